@@ -1,7 +1,9 @@
+import numpy as np
 import streamlit as st
-import pandas as pd
 from src.data.loader import load_data
-from src.agent.agent import run_fraud_analysis
+from src.agent.agent import run_fraud_analysis_stream
+from src.agent import tools as agent_tools
+from src.agent.tools import set_reference_data, is_merchant_id
 
 # ───────────────────────── PAGE CONFIG ─────────────────────────
 st.set_page_config(
@@ -21,12 +23,50 @@ with st.sidebar:
     show_truth = st.checkbox("Show ground truth", value=True)
 
 # ───────────────────────── LOAD DATA ─────────────────────────
-@st.cache_resource  # Changed: cache_resource is better for data
+@st.cache_data(show_spinner=False)  # cache_data is the right cache for DataFrames
 def get_data(sample):
     return load_data(sample_frac=sample / 100)
 
+
+@st.cache_data(show_spinner=False)  # one isFraud scan per sample, not per rerun
+def fraud_indices(sample):
+    df = get_data(sample)
+    return df.index[df["isFraud"] == 1].to_numpy()
+
+
+@st.cache_data(show_spinner=False)  # footer aggregates: once per sample, not per rerun
+def summary_stats(sample):
+    df = get_data(sample)
+    return int(df["isFraud"].sum()), len(df)
+
+
+@st.cache_data(show_spinner=False)  # materialize rows once, index O(1) per rerun
+def as_records(sample):
+    df = get_data(sample)
+    if len(df) > 2_000_000:
+        return None  # too large to hold as dicts; fall back to per-row iloc
+    return df.to_dict("records")
+
 df = get_data(sample_pct)
 
+
+def share_data_with_tools(sample):
+    """Point the tools' process-wide index at the frame for this sample.
+
+    Deliberately not st.cache_resource: a cached injector skips the side
+    effect when a slider value repeats (5 → 10 → 5) and the tools keep
+    serving the stale index. The marker lives in the tools module — the
+    same scope as the index itself — so the rebuild happens exactly when
+    the tools hold data for a different sample, including one injected by
+    another session.
+    """
+    if getattr(agent_tools, "_injected_sample", None) != sample:
+        set_reference_data(get_data(sample))
+        agent_tools._injected_sample = sample
+
+
+share_data_with_tools(sample_pct)
+
 if df.empty:
     st.error("No data loaded.")
     st.stop()
@@ -39,6 +79,17 @@ st.subheader("📊 Transaction Selection")
 if "current_idx" not in st.session_state:
     st.session_state.current_idx = 0
 
+
+def _pick_random(df):
+    st.session_state.current_idx = int(df.sample(1).index[0])
+
+
+def _pick_fraud(sample):
+    frauds_idx = fraud_indices(sample)
+    if len(frauds_idx):
+        st.session_state.current_idx = int(np.random.choice(frauds_idx))
+
+
 col1, col2, col3 = st.columns([5, 2, 2])
 
 with col1:
@@ -47,18 +98,15 @@ with col1:
     )
 
 with col2:
-    if st.button("🔀 Random"):
-        st.session_state.current_idx = int(df.sample(1).index[0])
-        st.rerun()
+    # on_click sets state before the rerun resolves — no second rerun needed
+    st.button("🔀 Random", on_click=_pick_random, args=(df,))
 
 with col3:
-    frauds = df[df["isFraud"] == 1]
-    if not frauds.empty and st.button("⚠️ Fraud"):
-        st.session_state.current_idx = int(frauds.sample(1).index[0])
-        st.rerun()
+    st.button("⚠️ Fraud", on_click=_pick_fraud, args=(sample_pct,))
 
 idx = st.session_state.current_idx
-tx = df.iloc[idx].to_dict()
+records = as_records(sample_pct)
+tx = records[idx] if records is not None else df.iloc[idx].to_dict()
 
 # ───────────────────────── DISPLAY ─────────────────────────
 st.divider()
@@ -68,7 +116,8 @@ col1, col2 = st.columns([3, 2])
 
 with col1:
     st.markdown("**📋 Main Fields**")
-    st.dataframe(pd.DataFrame({
+    # Plain dicts: no DataFrame construction or Arrow serialization per rerun
+    st.table({
         "Field": ["Type", "Amount", "Origin", "Destination"],
         "Value": [
             tx.get("type"),
@@ -76,11 +125,11 @@ with col1:
             tx.get("nameOrig"),
             tx.get("nameDest")
         ]
-    }), hide_index=True, width='stretch')
+    })
 
 with col2:
     st.markdown("**💰 Balances**")
-    st.dataframe(pd.DataFrame({
+    st.table({
         "Type": ["Old", "New"],
         "Origin": [
             f"{tx.get('oldbalanceOrg', 0):,.0f}",
@@ -90,7 +139,7 @@ with col2:
             f"{tx.get('oldbalanceDest', 0):,.0f}",
             f"{tx.get('newbalanceDest', 0):,.0f}"
         ]
-    }), hide_index=True, width='stretch')
+    })
 
 # Quick Metrics
 st.markdown("**📊 Quick Stats**")
@@ -99,7 +148,7 @@ c1, c2, c3, c4 = st.columns(4)
 ratio = tx.get('amount', 0) / max(tx.get('oldbalanceOrg', 1), 1)
 c1.metric("Ratio", f"{ratio:.1f}x")
 
-merchant = "Yes ✓" if str(tx.get("nameDest", "")).startswith("M") else "No"
+merchant = "Yes ✓" if is_merchant_id(str(tx.get("nameDest", ""))) else "No"
 c2.metric("Merchant", merchant)
 
 risk = "High ⚠️" if tx.get("type") in ["TRANSFER", "CASH_OUT"] else "Safe ✓"
@@ -116,30 +165,28 @@ if show_raw:
 st.divider()
 
 if st.button("🔍 ANALYZE TRANSACTION", type="primary", width='stretch'):
-    with st.spinner("Running 4-signal analysis..."):
-        result = run_fraud_analysis(tx, mode="production")
-        st.subheader("🤖 Agent Analysis")
-        st.markdown(result)
-
-        if show_truth:
-            st.divider()
-            truth = "🔴 FRAUD" if tx.get("isFraud") else "🟢 LEGITIMATE"
-            color = "red" if tx.get("isFraud") else "green"
-            st.markdown(
-                f"**Ground Truth:** <span style='color:{color}'>{truth}</span>",
-                unsafe_allow_html=True
-            )
+    st.subheader("🤖 Agent Analysis")
+    # Stream tokens as they are generated instead of a blank spinner
+    st.write_stream(run_fraud_analysis_stream(tx, mode="production"))
+
+    if show_truth:
+        st.divider()
+        truth = "🔴 FRAUD" if tx.get("isFraud") else "🟢 LEGITIMATE"
+        color = "red" if tx.get("isFraud") else "green"
+        st.markdown(
+            f"**Ground Truth:** <span style='color:{color}'>{truth}</span>",
+            unsafe_allow_html=True
+        )
 
 # ───────────────────────── FOOTER ─────────────────────────
 st.divider()
 
 col1, col2, col3 = st.columns(3)
 
-col1.metric("Transactions", f"{len(df):,}")
-
-fraud_count = df["isFraud"].sum()
-fraud_pct = fraud_count / len(df) * 100
+fraud_count, total_rows = summary_stats(sample_pct)
+fraud_pct = fraud_count / total_rows * 100
 
+col1.metric("Transactions", f"{total_rows:,}")
 col2.metric("Fraud Cases", f"{fraud_count:,}", f"{fraud_pct:.2f}%")
 col3.metric("Sample Size", f"{sample_pct}%")
 
@@ -9,93 +9,264 @@ Tools:
   5. compare_to_account_average - Check if amount is typical
 """
 
+from functools import lru_cache
+
 from langchain_core.tools import tool
-from src.data.loader import load_data
+from src.data.loader import DATA_PATH, PARQUET_PATH, DTYPES
+import numpy as np
 import pandas as pd
 
-# Load data once (reuse across tool calls)
-df = load_data(sample_frac=0.01)  # Use 1% sample for performance
+# ═══════════════════════════════════════════════════════════════════════════
+# COLUMNAR DATA CACHE (built once at import)
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Only the five columns the tools actually read. Loading the full DataFrame
+# (both string ID columns plus all four balance columns) just to answer these
+# lookups wastes memory and import time; the arrays below are all that stays
+# resident.
+_TOOL_COLUMNS = ["nameOrig", "type", "amount", "isFraud", "step"]
+
+
+def _load_columns(sample_frac: float | None = None) -> pd.DataFrame:
+    """Load only the tool columns from parquet (fast) or CSV (fallback)."""
+    if PARQUET_PATH.is_file():
+        cols = pd.read_parquet(PARQUET_PATH, columns=_TOOL_COLUMNS)
+    else:
+        cols = pd.read_csv(
+            DATA_PATH,
+            usecols=_TOOL_COLUMNS,
+            dtype={k: DTYPES[k] for k in _TOOL_COLUMNS},
+        )
+    if sample_frac is not None:
+        cols = cols.sample(frac=sample_frac, random_state=42)
+    return cols.reset_index(drop=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SHARED INDEX STATE (built by set_reference_data, or lazily on first use)
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Populated by _build_index(). Kept as module globals so tool calls are
+# plain array/dict lookups with no pandas work.
+_by_orig = None
+_amount_stats = None
+_account_to_int = None
+_type_codes = None
+_type_names = None
+amount_arr = None
+is_fraud_arr = None
+step_arr = None
+_tx_cnt = None
+_fraud_cnt = None
+_amt_sum = None
+_amt_max = None
+_type_cnt = None
+
+
+def set_reference_data(data: pd.DataFrame) -> None:
+    """Build the tool indexes from an already-loaded DataFrame.
+
+    Lets the Streamlit app inject the DataFrame it already cached instead of
+    the tools re-parsing the same dataset at import — one load per process.
+    """
+    # Reuse the loader's prebuilt origin index when present (load_data
+    # attaches it in df.attrs) rather than grouping the column again.
+    _build_index(data[_TOOL_COLUMNS],
+                 origin_index=data.attrs.get("origin_index"))
+
+
+def _ensure_data() -> None:
+    """Lazily load and index the 1% sample if nothing was injected."""
+    if _by_orig is None:
+        _build_index(_load_columns(sample_frac=0.01))
+
+
+def _build_index(cols: pd.DataFrame, origin_index: dict | None = None) -> None:
+    """One pass over the data to build all per-account lookup structures."""
+    global _by_orig, _amount_stats, _account_to_int, _type_codes, _type_names
+    global amount_arr, is_fraud_arr, step_arr
+    global _tx_cnt, _fraud_cnt, _amt_sum, _amt_max, _type_cnt
+
+    cols = cols.reset_index(drop=True)
+
+    # Map nameOrig -> row positions. Built in one pass so every tool call is
+    # a dict probe + slice instead of scanning the full nameOrig column (O(N)
+    # per LLM tool call otherwise — the dominant per-call cost).
+    if origin_index is None:
+        origin_index = cols.groupby("nameOrig", sort=False).indices
+    _by_orig = origin_index
+
+    # Per-(account, type) amount statistics, precomputed in one groupby pass
+    # so compare_to_account_average never recomputes mean/std per call.
+    _amount_stats = (
+        cols.groupby(["nameOrig", "type"], sort=False, observed=True)["amount"]
+        .agg(["mean", "std", "count"])
+    )
+
+    # Dense NumPy arrays (SoA) indexed by a compact account -> int mapping.
+    # A stats lookup then touches a few array cells instead of re-scanning
+    # the account's rows. float32 amounts halve bandwidth on this
+    # memory-bound path, uint8/int32 keep the rest compact.
+    _orig_codes, _orig_accounts = pd.factorize(cols["nameOrig"], sort=False)
+    _account_to_int = {name: i for i, name in enumerate(_orig_accounts)}
+
+    _type_codes, _type_names = pd.factorize(cols["type"], sort=False)
+    _type_names = list(_type_names)
+
+    amount_arr = cols["amount"].to_numpy(dtype=np.float32)
+    is_fraud_arr = cols["isFraud"].to_numpy(dtype=np.uint8)
+    step_arr = cols["step"].to_numpy(dtype=np.int32)
+
+    n_accounts = len(_orig_accounts)
+    _tx_cnt = np.bincount(_orig_codes, minlength=n_accounts)
+    _fraud_cnt = np.bincount(_orig_codes, weights=is_fraud_arr, minlength=n_accounts).astype(np.int64)
+    _amt_sum = np.bincount(_orig_codes, weights=amount_arr, minlength=n_accounts)
+    _amt_max = np.zeros(n_accounts, dtype=np.float64)
+    np.maximum.at(_amt_max, _orig_codes, amount_arr)
+    _type_cnt = np.zeros((n_accounts, len(_type_names)), dtype=np.int64)
+    np.add.at(_type_cnt, (_orig_codes, _type_codes), 1)
+
+    # Cached results belong to the previous dataset — drop them
+    _account_type_stats.cache_clear()
+    _compute_origin_history.cache_clear()
+    _compute_account_statistics.cache_clear()
+    _compute_amount_comparison.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _account_type_stats(origin_id: str, tx_type: str):
+    """Look up precomputed (mean, std, count) for an account/type pair.
+
+    Returns None if the account has never done this transaction type.
+    std is None for single-row groups — nearly every account in PaySim —
+    where the aggregation yields NA (pd.NA on the Arrow backend) and
+    there is no spread to compare against.
+    """
+    try:
+        row = _amount_stats.loc[(origin_id, tx_type)]
+    except KeyError:
+        return None
+    count = int(row["count"])
+    std = None if count < 2 or pd.isna(row["std"]) else float(row["std"])
+    return float(row["mean"]), std, count
 
 # ═══════════════════════════════════════════════════════════════════════════
 # TOOL 1: Get Origin History
 # ═══════════════════════════════════════════════════════════════════════════
 
 @tool
-def get_origin_history(origin_id: str, n: int = 10) -> str:
+def get_origin_history(origin_id: str, n: int = 10) -> dict:
     """Get recent transaction history for sender account.
-    
+
     Use this to determine:
     - Is this a NEW account? (no history = risky)
     - Does the account normally do TRANSFER/CASH_OUT? (trusted pattern)
     - Has this account committed fraud before? (risky)
-    
+
     Args:
         origin_id: The sender's account ID (nameOrig)
         n: Number of recent transactions to retrieve
-    
+
     Returns:
-        String with transaction history and risk assessment
+        Dict with recent transactions, account stats and signal score
     """
-    
-    mask = df["nameOrig"] == origin_id
-    
-    if not mask.any():
-        return (
-            f"⚠️ Account {origin_id}: NO TRANSACTION HISTORY\n"
-            f"   Risk: NEW/UNKNOWN ACCOUNT\n"
-            f"   Signal Score: +2 points (risky)\n"
-            f"   Recommendation: Apply stricter fraud checks"
-        )
-    
-    # Get recent transactions
-    recent = df[mask].sort_values("step", ascending=False).head(n)
-    fraud_count = recent["isFraud"].sum()
-    fraud_rate = (fraud_count / len(recent)) * 100 if len(recent) > 0 else 0
-    
+
+    _ensure_data()
+    return _compute_origin_history(origin_id, n)
+
+
+@lru_cache(maxsize=4096)
+def _compute_origin_history(origin_id: str, n: int) -> dict:
+    """Inner compute for get_origin_history. The same account recurs within
+    one analysis and across related batches, so repeat calls become a cache
+    probe. Cleared by _build_index() when the data is reloaded."""
+    idx = _by_orig.get(origin_id)
+
+    if idx is None:
+        return {
+            "account": origin_id,
+            "history_found": False,
+            "assessment": "NEW_OR_UNKNOWN_ACCOUNT",
+            "signal": 2,
+        }
+
+    # Get recent transactions (most recent n rows from the columnar arrays).
+    # argpartition selects the top-n in O(k) instead of fully sorting the
+    # account's history; only the n survivors get sorted for display.
+    steps = step_arr[idx]
+    if len(steps) > n:
+        top = idx[np.argpartition(-steps, n)[:n]]
+    else:
+        top = idx
+    top = top[np.argsort(step_arr[top])[::-1]]
+    types = [_type_names[c] for c in _type_codes[top]]
+    frauds = is_fraud_arr[top]
+    amounts = amount_arr[top]
+
+    fraud_count = int(frauds.sum())
+    fraud_rate = (fraud_count / len(top)) * 100 if len(top) > 0 else 0
+
     # Calculate statistics
-    transfer_count = (recent["type"] == "TRANSFER").sum()
-    cashout_count = (recent["type"] == "CASH_OUT").sum()
+    transfer_count = types.count("TRANSFER")
+    cashout_count = types.count("CASH_OUT")
     high_risk_txs = transfer_count + cashout_count
-    avg_amount = recent["amount"].mean()
-    max_amount = recent["amount"].max()
-    
-    # Get transaction details
-    history_text = recent[["step", "type", "amount", "isFraud"]].to_string()
-    
+
     # Risk assessment
     if fraud_rate > 5:
-        assessment = "🔴 RISKY ACCOUNT: Past fraud detected"
-        signal = "+2"
+        assessment = "RISKY_PAST_FRAUD"
+        signal = 2
     elif high_risk_txs >= 5:
-        assessment = "🟢 TRUSTED ACCOUNT: Frequent TRANSFER/CASH_OUT (normal pattern)"
-        signal = "-2"
-    elif len(recent) < 3:
-        assessment = "🟡 LIMITED HISTORY: Few prior transactions"
-        signal = "+1"
+        assessment = "TRUSTED_FREQUENT_TRANSFER_CASHOUT"
+        signal = -2
+    elif len(top) < 3:
+        assessment = "LIMITED_HISTORY"
+        signal = 1
     elif fraud_rate > 0:
-        assessment = "🟠 CAUTION: Some fraud in history"
-        signal = "+1"
+        assessment = "SOME_FRAUD_IN_HISTORY"
+        signal = 1
     else:
-        assessment = "🟢 NORMAL BEHAVIOR: No fraud history"
-        signal = "-1"
-    
-    return f"""Transaction History for {origin_id}:
+        assessment = "NORMAL_BEHAVIOR"
+        signal = -1
 
-Recent Transactions (last {min(n, len(recent))}):
-{history_text}
+    return {
+        "account": origin_id,
+        "history_found": True,
+        "transactions_analyzed": int(len(top)),
+        "fraud_count": fraud_count,
+        "fraud_rate_pct": round(fraud_rate, 1),
+        "transfer_count": transfer_count,
+        "cashout_count": cashout_count,
+        "high_risk_txs": high_risk_txs,
+        "avg_amount": round(float(amounts.mean()), 2),
+        "max_amount": round(float(amounts.max()), 2),
+        "recent": [
+            {"step": int(s), "type": t, "amount": round(float(a), 2), "isFraud": int(f)}
+            for s, t, a, f in zip(step_arr[top], types, amounts, frauds)
+        ],
+        "assessment": assessment,
+        "signal": signal,
+    }
 
-Account Statistics:
-  • Total transactions analyzed: {len(recent)}
-  • Fraud count: {fraud_count}
-  • Fraud rate: {fraud_rate:.1f}%
-  • TRANSFER count: {transfer_count}
-  • CASH_OUT count: {cashout_count}
-  • High-risk transactions: {high_risk_txs}
-  • Avg transaction amount: {avg_amount:,.0f}
-  • Max transaction amount: {max_amount:,.0f}
 
-Risk Assessment: {assessment}
-Signal Score: {signal} points"""
+def format_history_for_human(history: dict) -> str:
+    """Render a get_origin_history result for display/logging."""
+    if not history.get("history_found"):
+        return (
+            f"⚠️ Account {history['account']}: NO TRANSACTION HISTORY\n"
+            f"   Risk: NEW/UNKNOWN ACCOUNT\n"
+            f"   Signal Score: +{history['signal']} points (risky)"
+        )
+    rows = "\n".join(
+        f"  step {r['step']:>4}  {r['type']:<9} {r['amount']:>14,.0f}  fraud={r['isFraud']}"
+        for r in history["recent"]
+    )
+    return (
+        f"Transaction History for {history['account']}:\n"
+        f"{rows}\n"
+        f"  Fraud rate: {history['fraud_rate_pct']}%  "
+        f"High-risk txs: {history['high_risk_txs']}\n"
+        f"  Assessment: {history['assessment']}  Signal: {history['signal']:+d}"
+    )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -103,120 +274,125 @@ Signal Score: {signal} points"""
 # ═══════════════════════════════════════════════════════════════════════════
 
 @tool
-def check_balance_anomaly(amount: float, oldbalanceOrg: float, tx_type: str) -> str:
+def check_balance_anomaly(amount: float, oldbalanceOrg: float, tx_type: str) -> dict:
     """Check if transaction amount exceeds available balance.
-    
+
     IMPORTANT: Balance anomaly is a WEAK signal (appears in 15% of legitimate).
     Use in combination with other signals.
-    
+
     Args:
         amount: Transaction amount
         oldbalanceOrg: Sender's balance before transaction
         tx_type: Transaction type (TRANSFER, CASH_OUT, etc.)
-    
+
     Returns:
-        String with anomaly analysis and signal score
+        Dict with anomaly severity, ratio and signal score
     """
-    
+
     # Safe types: skip balance check
     if tx_type in ["PAYMENT", "CASH_IN", "DEBIT"]:
-        return (
-            f"✓ {tx_type}: Low-risk transaction type\n"
-            f"   Balance check not applicable\n"
-            f"   Signal Score: 0 points"
-        )
-    
+        return {
+            "tx_type": tx_type,
+            "severity": "NOT_APPLICABLE",
+            "note": "Low-risk transaction type, balance check not applicable",
+            "signal": 0,
+        }
+
     # Cannot assess with no balance data
     if oldbalanceOrg <= 0:
-        return (
-            f"⚠️ No available balance data\n"
-            f"   Amount: {amount:,.0f}\n"
-            f"   Signal Score: 0 points (cannot assess)"
-        )
-    
+        return {
+            "tx_type": tx_type,
+            "amount": amount,
+            "severity": "NO_BALANCE_DATA",
+            "note": "Cannot assess without balance data",
+            "signal": 0,
+        }
+
     # Calculate ratio
     ratio = amount / oldbalanceOrg
-    
+
     if ratio > 2.0:
-        return (
-            f"🔴 SEVERE ANOMALY:\n"
-            f"   Amount: {amount:,.0f}\n"
-            f"   Balance: {oldbalanceOrg:,.0f}\n"
-            f"   Ratio: {ratio:.2f}x\n"
-            f"   Assessment: Very unusual. Amount is {ratio:.1f} times the available balance.\n"
-            f"   Context: Mobile money systems may have credit/overdraft, but this is high risk.\n"
-            f"   Signal Score: +2 points"
-        )
-    
+        severity, signal = "SEVERE", 2
+        note = "Very unusual: amount far exceeds available balance"
     elif ratio > 1.5:
-        return (
-            f"🟠 MODERATE ANOMALY:\n"
-            f"   Amount: {amount:,.0f}\n"
-            f"   Balance: {oldbalanceOrg:,.0f}\n"
-            f"   Ratio: {ratio:.2f}x\n"
-            f"   Assessment: Amount exceeds balance.\n"
-            f"   Context: This appears in ~15% of legitimate PaySim transactions.\n"
-            f"   Signal Score: +1 point"
-        )
-    
+        severity, signal = "MODERATE", 1
+        note = "Amount exceeds balance; appears in ~15% of legitimate transactions"
     elif ratio > 1.0:
-        return (
-            f"🟡 MILD ANOMALY:\n"
-            f"   Amount: {amount:,.0f}\n"
-            f"   Balance: {oldbalanceOrg:,.0f}\n"
-            f"   Ratio: {ratio:.2f}x\n"
-            f"   Assessment: Amount slightly exceeds balance.\n"
-            f"   Context: Common in PaySim. Accounts may have credit lines.\n"
-            f"   Signal Score: +0.5 points"
-        )
-    
+        severity, signal = "MILD", 0.5
+        note = "Amount slightly exceeds balance; common (credit lines)"
     else:
-        return (
-            f"✓ NO ANOMALY:\n"
-            f"   Amount: {amount:,.0f}\n"
-            f"   Balance: {oldbalanceOrg:,.0f}\n"
-            f"   Ratio: {ratio:.2f}x\n"
-            f"   Assessment: Amount is within available balance. Safe.\n"
-            f"   Signal Score: 0 points"
-        )
+        severity, signal = "NONE", 0
+        note = "Amount within available balance"
+
+    return {
+        "tx_type": tx_type,
+        "amount": amount,
+        "old_balance": oldbalanceOrg,
+        "ratio": round(ratio, 2),
+        "severity": severity,
+        "note": note,
+        "signal": signal,
+    }
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # TOOL 3: Is Merchant Account
 # ═══════════════════════════════════════════════════════════════════════════
 
+def is_merchant_id(x: str) -> bool:
+    """True if the account ID carries the merchant 'M' prefix.
+
+    Single source of truth for the merchant check — app.py and the agent
+    tool both use this instead of duplicating the string test.
+    """
+    return bool(x) and x[0] == "M"
+
+
 @tool
-def is_merchant_account(dest_id: str) -> str:
+def is_merchant_account(dest_id: str) -> dict:
     """Check if destination account is a merchant.
-    
+
     Merchants (account ID starts with 'M'):
     - Usually payment processors or retailers
     - Have oldbalanceDest ≈ 0 (no personal balance)
     - Lower fraud risk
-    
+
     Args:
         dest_id: Destination account ID (nameDest)
-    
+
     Returns:
-        String with account type and signal score
+        Dict with account type and signal score
     """
-    
-    if dest_id.startswith("M"):
-        return (
-            f"✓ MERCHANT ACCOUNT: {dest_id}\n"
-            f"   Type: Payment processor or business account\n"
-            f"   Risk Profile: LOWER (merchants are generally safe)\n"
-            f"   Typical Use: Legitimate purchases, bill payments\n"
-            f"   Signal Score: -1 point (safer)"
-        )
-    else:
-        return (
-            f"🟡 REGULAR USER ACCOUNT: {dest_id}\n"
-            f"   Type: Personal/regular user account\n"
-            f"   Risk Profile: NEUTRAL (can be fraud or legitimate)\n"
-            f"   Assessment: Requires other signals to assess risk\n"
-            f"   Signal Score: 0 points"
-        )
+
+    if is_merchant_id(dest_id):
+        return {
+            "dest": dest_id,
+            "is_merchant": True,
+            "risk_profile": "LOWER",
+            "note": "Payment processor or business account",
+            "signal": -1,
+        }
+    return {
+        "dest": dest_id,
+        "is_merchant": False,
+        "risk_profile": "NEUTRAL",
+        "note": "Regular user account; requires other signals to assess risk",
+        "signal": 0,
+    }
+
+
+def is_merchant_vec(dest_ids) -> np.ndarray:
+    """Vectorized merchant check for batch scoring paths.
+
+    Runs the prefix test in one C-level pass instead of a Python loop.
+
+    Args:
+        dest_ids: Array/Series of destination account IDs
+
+    Returns:
+        Boolean NumPy array, True where the ID has the merchant 'M' prefix
+    """
+    return pd.Series(dest_ids).str.startswith("M").fillna(False).to_numpy()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -224,39 +400,49 @@ def is_merchant_account(dest_id: str) -> str:
 # ═══════════════════════════════════════════════════════════════════════════
 
 @tool
-def get_account_statistics(account_id: str) -> str:
+def get_account_statistics(account_id: str) -> dict:
     """Get comprehensive statistics for an account.
-    
+
     Useful for assessing overall account risk and fraud history.
-    
+
     Args:
         account_id: The account ID (nameOrig)
-    
+
     Returns:
-        String with account statistics
+        Dict with account statistics and risk level
     """
-    
-    mask = df["nameOrig"] == account_id
-    
-    if not mask.any():
-        return f"No transaction history for {account_id}"
-    
-    txs = df[mask]
-    fraud_count = txs["isFraud"].sum()
-    fraud_rate = (fraud_count / len(txs)) * 100 if len(txs) > 0 else 0
-    
-    # Type breakdown
-    type_counts = txs["type"].value_counts().to_dict()
-    
-    return (
-        f"Account Statistics for {account_id}:\n"
-        f"  • Total transactions: {len(txs)}\n"
-        f"  • Fraud count: {fraud_count}\n"
-        f"  • Fraud rate: {fraud_rate:.2f}%\n"
-        f"  • Avg transaction amount: {txs['amount'].mean():,.0f}\n"
-        f"  • Transaction types: {type_counts}\n"
-        f"  • Risk level: {'🔴 HIGH (>5% fraud)' if fraud_rate > 5 else '🟢 NORMAL'}"
-    )
+
+    _ensure_data()
+    return _compute_account_statistics(account_id)
+
+
+@lru_cache(maxsize=4096)
+def _compute_account_statistics(account_id: str) -> dict:
+    """Inner compute for get_account_statistics, cached per account."""
+    i = _account_to_int.get(account_id)
+
+    if i is None:
+        return {"account": account_id, "found": False}
+
+    # Pure O(1) array reads from the precomputed aggregates
+    total = int(_tx_cnt[i])
+    fraud_count = int(_fraud_cnt[i])
+    fraud_rate = (fraud_count / total) * 100 if total > 0 else 0
+    avg_amount = _amt_sum[i] / total if total > 0 else 0
+
+    return {
+        "account": account_id,
+        "found": True,
+        "total_transactions": total,
+        "fraud_count": fraud_count,
+        "fraud_rate_pct": round(fraud_rate, 2),
+        "avg_amount": round(float(avg_amount), 2),
+        "max_amount": round(float(_amt_max[i]), 2),
+        "transaction_types": {
+            t: int(c) for t, c in zip(_type_names, _type_cnt[i]) if c
+        },
+        "risk_level": "HIGH" if fraud_rate > 5 else "NORMAL",
+    }
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -264,61 +450,81 @@ def get_account_statistics(account_id: str) -> str:
 # ═══════════════════════════════════════════════════════════════════════════
 
 @tool
-def compare_to_account_average(origin_id: str, amount: float, tx_type: str) -> str:
+def compare_to_account_average(origin_id: str, amount: float, tx_type: str) -> dict:
     """Check if transaction amount is typical for this account.
-    
+
     Unusual amounts may indicate fraud or account takeover.
-    
+
     Args:
         origin_id: Sender account ID
         amount: Transaction amount
         tx_type: Transaction type (TRANSFER, CASH_OUT, etc.)
-    
+
     Returns:
-        String with comparison and signal score
+        Dict with comparison result and signal score
     """
-    
-    mask = df["nameOrig"] == origin_id
-    
-    if not mask.any():
-        return (
-            f"⚠️ New account {origin_id}\n"
-            f"   Cannot compare to account average\n"
-            f"   Signal Score: +1 point (unusual - no baseline)"
-        )
-    
-    account_txs = df[mask]
-    same_type = account_txs[account_txs["type"] == tx_type]
-    
-    if len(same_type) == 0:
-        return (
-            f"⚠️ Account {origin_id} has never done {tx_type} before\n"
-            f"   Amount: {amount:,.0f}\n"
-            f"   First transaction of this type\n"
-            f"   Signal Score: +1 point (unusual behavior)"
-        )
-    
-    avg = same_type["amount"].mean()
-    std = same_type["amount"].std()
+
+    _ensure_data()
+    return _compute_amount_comparison(origin_id, amount, tx_type)
+
+
+@lru_cache(maxsize=4096)
+def _compute_amount_comparison(origin_id: str, amount: float, tx_type: str) -> dict:
+    """Inner compute for compare_to_account_average, cached per call key."""
+    if origin_id not in _by_orig:
+        return {
+            "account": origin_id,
+            "assessment": "NO_BASELINE",
+            "note": "New account, cannot compare to account average",
+            "signal": 1,
+        }
+
+    stats = _account_type_stats(origin_id, tx_type)
+
+    if stats is None:
+        return {
+            "account": origin_id,
+            "amount": amount,
+            "assessment": "FIRST_OF_TYPE",
+            "note": f"Account has never done {tx_type} before",
+            "signal": 1,
+        }
+
+    avg, std, _count = stats
+
+    if std is None:
+        # One prior transaction of this type: there is an average but no
+        # spread, so treat it like FIRST_OF_TYPE rather than comparing
+        # against a meaningless 2-sigma bound.
+        return {
+            "account": origin_id,
+            "amount": amount,
+            "account_average": round(avg, 2),
+            "assessment": "INSUFFICIENT_BASELINE",
+            "note": f"Only one prior {tx_type}; no spread to compare against",
+            "signal": 1,
+        }
+
     upper_bound = avg + 2 * std
-    
+
     if amount > upper_bound:
-        return (
-            f"🔴 UNUSUAL AMOUNT for {origin_id}:\n"
-            f"   Current amount: {amount:,.0f}\n"
-            f"   Account average: {avg:,.0f}\n"
-            f"   Upper bound (mean + 2σ): {upper_bound:,.0f}\n"
-            f"   Assessment: Far above typical for this account\n"
-            f"   Signal Score: +1 point"
-        )
-    else:
-        return (
-            f"✓ TYPICAL AMOUNT for {origin_id}:\n"
-            f"   Current amount: {amount:,.0f}\n"
-            f"   Account average: {avg:,.0f}\n"
-            f"   Assessment: Within normal range for this account\n"
-            f"   Signal Score: -1 point (normal behavior)"
-        )
+        return {
+            "account": origin_id,
+            "amount": amount,
+            "account_average": round(avg, 2),
+            "upper_bound": round(upper_bound, 2),
+            "assessment": "UNUSUAL_AMOUNT",
+            "note": "Far above typical for this account (mean + 2σ)",
+            "signal": 1,
+        }
+    return {
+        "account": origin_id,
+        "amount": amount,
+        "account_average": round(avg, 2),
+        "assessment": "TYPICAL_AMOUNT",
+        "note": "Within normal range for this account",
+        "signal": -1,
+    }
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -336,8 +542,8 @@ tools = [
 if __name__ == "__main__":
     # Test tools
     print("🔄 Testing tools...")
-    print(get_origin_history("C1000000001"))
+    print(format_history_for_human(get_origin_history.func("C1000000001")))
     print("\n" + "="*80 + "\n")
-    print(check_balance_anomaly(100000, 50000, "CASH_OUT"))
+    print(check_balance_anomaly.func(100000, 50000, "CASH_OUT"))
     print("\n" + "="*80 + "\n")
-    print(is_merchant_account("M123456"))
+    print(is_merchant_account.func("M123456"))
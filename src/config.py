@@ -13,8 +13,9 @@ llm = ChatOpenAI(
     model="gpt-4o-mini",  # Fast and cost-effective
     # model="gpt-4o",     # Alternative: stronger results but more expensive
     temperature=0.3,      # Lower = more deterministic
-    max_tokens=1500,      # Limit response length
+    max_tokens=400,       # Latency scales with output tokens; verdicts are short
     api_key=api_key,
+    seed=0,               # Reproducible sampling across identical requests
 )
 
 
@@ -9,9 +9,14 @@ Features:
 - Caching and optimization
 """
 
+# pandas/numpy/pyarrow are imported lazily inside the functions that use
+# them: importing the package for prompts or config alone then costs
+# milliseconds instead of the ~0.5 s pandas cold import. Annotations stay
+# strings (PEP 563) so pd.DataFrame in signatures never evaluates.
+from __future__ import annotations
+
+from functools import lru_cache
 from pathlib import Path
-import pandas as pd
-import os
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -23,7 +28,7 @@ PARQUET_PATH = BASE_DIR / "data" / "paysim.parquet"
 
 # Optimized dtypes to reduce memory usage
 DTYPES = {
-    "step": "int32",
+    "step": "uint16",     # PaySim max step is 744 — fits with room to spare
     "type": "category",
     "amount": "float32",
     "nameOrig": "string",
@@ -32,25 +37,32 @@ DTYPES = {
     "nameDest": "string",
     "oldbalanceDest": "float32",
     "newbalanceDest": "float32",
-    "isFraud": "int8",
-    "isFlaggedFraud": "int8",
+    # Parquet stores BOOLEAN as 1 bit/row and the ~0.13% fraud rate means
+    # the all-zero runs RLE to almost nothing — the whole column chunk fits
+    # in cache, so isFraud scans and sums are effectively free.
+    "isFraud": "bool",
+    "isFlaggedFraud": "bool",
 }
 
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN LOAD FUNCTION - AUTO FORMAT DETECTION
 # ═══════════════════════════════════════════════════════════════════════════
 
-def load_data(sample_frac: float | None = None) -> pd.DataFrame:
+def load_data(sample_frac: float | None = None,
+              columns: list[str] | None = None) -> pd.DataFrame:
     """
     Load PaySim dataset with automatic format detection and optimization.
-    
-    Automatically loads from parquet if available (10x faster), 
+
+    Automatically loads from parquet if available (10x faster),
     falls back to CSV if parquet doesn't exist.
-    
+
     Args:
         sample_frac: Fraction of data to sample (0-1). None = load all.
                     Examples: 0.01 = 1%, 0.05 = 5%, 0.1 = 10%
-    
+        columns: Subset of columns to load (None = all). Parquet skips the
+                unreferenced column chunks entirely, so reading 2 of the 11
+                columns reads ~2/11ths of the bytes.
+
     Returns:
         DataFrame with PaySim transactions (optimized dtypes)
     
@@ -74,12 +86,12 @@ def load_data(sample_frac: float | None = None) -> pd.DataFrame:
     
     # Try parquet first (10x faster)
     if PARQUET_PATH.is_file():
-        return _load_parquet(sample_frac)
-    
+        src = PARQUET_PATH
+
     # Fallback to CSV
     elif DATA_PATH.is_file():
-        return _load_csv(sample_frac)
-    
+        src = DATA_PATH
+
     # Not found
     else:
         raise FileNotFoundError(
@@ -93,67 +105,279 @@ def load_data(sample_frac: float | None = None) -> pd.DataFrame:
             f"   python src/data/loader.py --convert-to-parquet"
         )
 
+    cols_key = None if columns is None else tuple(columns)
+    df = _load_data_cached(str(src), src.stat().st_mtime_ns, sample_frac, cols_key)
+    # Shallow copy: callers can add/drop columns without poisoning the cache
+    return df.copy(deep=False)
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Attach precomputed helper columns used by the signal checks.
+
+    dest_is_merchant runs the 'M'-prefix test once as a vectorized C
+    kernel over the whole column (~ms for the full frame) instead of a
+    per-row Python string call wherever the signal is needed.
+    """
+    if "nameDest" in df.columns and "dest_is_merchant" not in df.columns:
+        df["dest_is_merchant"] = (
+            df["nameDest"].astype("string").str.startswith("M").fillna(False)
+        )
+
+    # {nameOrig: row positions} map, built in a single C pass. Signal-A
+    # history lookups then cost a dict hit + iloc view instead of an O(N)
+    # column scan per transaction (O(N^2) over a batch).
+    if "nameOrig" in df.columns and "origin_index" not in df.attrs:
+        df.attrs["origin_index"] = (
+            df.groupby("nameOrig", sort=False, observed=True).indices
+        )
+    return df
+
+
+def _resolve_sample(n: int, sample_frac: float | None) -> int | None:
+    """Validate sample_frac once and turn it into a row count.
+
+    Returns None when no sampling was requested, otherwise the number of
+    rows to draw (at least 1). Every loader funnels through here, so the
+    range check lives in exactly one place.
+    """
+    if sample_frac is None:
+        return None
+    if not (0 < sample_frac <= 1):
+        raise ValueError("sample_frac must be between 0 and 1")
+    return max(1, int(round(n * sample_frac)))
+
+
+def _take_sample(df: pd.DataFrame, n: int) -> pd.DataFrame:
+    """Random n-row sample as a single sorted gather.
+
+    Draws row positions with the seeded generator, sorts them, then takes
+    once. Deterministic, but NOT the same rows as df.sample(random_state=42)
+    — PCG64 and df.sample's MT19937 draw differently. The sorted take walks
+    the column buffers forward (sequential reads the hardware prefetcher
+    likes, vs the random-order gather df.sample does) and keeps the
+    original row order.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(42)
+    idx = rng.choice(len(df), size=n, replace=False)
+    idx.sort()
+    return df.take(idx).reset_index(drop=True)
+
+
+@lru_cache(maxsize=4)
+def _load_data_cached(path: str, mtime_ns: int, sample_frac: float | None,
+                      cols_key: tuple | None) -> pd.DataFrame:
+    """Memoized load keyed by (path, mtime, sample, columns).
+
+    Repeated loads within a session — load_data_by_type and
+    load_fraud_only both ask for the full frame — hit the cache instead
+    of re-decoding the file. The mtime key invalidates on rewrite.
+    """
+    columns = None if cols_key is None else list(cols_key)
+    if path.endswith(".parquet"):
+        return add_derived_columns(_load_parquet(sample_frac, columns))
+    return add_derived_columns(_load_csv(sample_frac, columns))
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PARQUET LOADING (FASTEST)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def _load_parquet(sample_frac: float | None = None) -> pd.DataFrame:
+def _load_parquet(sample_frac: float | None = None,
+                  columns: list[str] | None = None) -> pd.DataFrame:
     """
     Load from parquet format (10x faster than CSV).
-    
+
     Performance:
     - 1% sample: ~0.5s
     - 5% sample: ~2s
     - 10% sample: ~5s
     - 100% sample: ~15s
     """
-    df = pd.read_parquet(PARQUET_PATH)
-    
-    if sample_frac is not None:
-        if not (0 < sample_frac <= 1):
-            raise ValueError("sample_frac must be between 0 and 1")
-        df = df.sample(frac=sample_frac, random_state=42)
-    
-    return df.reset_index(drop=True)
+    import numpy as np
+    import pandas as pd
+
+    # Small samples: read a random subset of row groups instead of decoding
+    # the whole file and sampling afterwards. Snappy decode + Arrow->pandas
+    # conversion dominate parquet load time, so cutting input bytes is the
+    # only real lever. Above 50% the subset approach stops paying off.
+    # Only valid when rows are spread across groups in input order — on a
+    # type-sorted file (convert_csv_to_parquet sort=True) a group subset is
+    # a biased slice, so we fall back to full read + row sampling there.
+    if sample_frac is not None and sample_frac <= 0.5:
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(PARQUET_PATH)
+        n_groups = pf.num_row_groups
+        k = _resolve_sample(n_groups, sample_frac)
+        if k < n_groups and not _type_clustered(pf):
+            rng = np.random.default_rng(42)
+            picks = np.sort(rng.choice(n_groups, k, replace=False))
+            df = pf.read_row_groups(list(picks), columns=columns).to_pandas(
+                types_mapper=pd.ArrowDtype)
+            # Trim to the exact requested fraction of the full dataset
+            target = _resolve_sample(pf.metadata.num_rows, sample_frac)
+            if target < len(df):
+                df = _take_sample(df, target)
+            return df
+
+    # pyarrow-backed columns are zero-copy views over the Arrow buffers —
+    # no NumPy block consolidation memcpy on load.
+    df = pd.read_parquet(PARQUET_PATH, engine='pyarrow',
+                         dtype_backend='pyarrow', columns=columns)
+
+    k = _resolve_sample(len(df), sample_frac)
+    if k is not None:
+        df = _take_sample(df, k)
+
+    # read_parquet already returns a RangeIndex; resetting unconditionally
+    # would just trigger another copy.
+    return df
+
+
+def _type_clustered(pf) -> bool:
+    """True when row groups cover ordered slices of `type`, i.e. the file
+    was written sorted by (type, isFraud, step).
+
+    On such a file a random subset of groups is NOT a random subset of
+    rows — whole transaction types and the tiny fraud slice can vanish
+    from a "sample". Detected from footer min/max statistics alone,
+    nothing is decoded: a single-valued group, or group ranges that never
+    overlap from one group to the next, can only come from a sorted
+    write, regardless of how few groups the file has. An input-order file
+    has every group spanning the full value range, which both tests
+    reject.
+    """
+    meta = pf.metadata
+    idx = meta.schema.to_arrow_schema().get_field_index("type")
+    if idx < 0 or meta.num_row_groups < 2:
+        return False
+    prev_max = None
+    for g in range(meta.num_row_groups):
+        stats = meta.row_group(g).column(idx).statistics
+        if stats is None or not stats.has_min_max:
+            return False  # no statistics — assume input-order legacy file
+        if stats.min == stats.max:
+            return True  # a one-type group only occurs in a sorted file
+        if prev_max is not None and stats.min < prev_max:
+            return False  # ranges overlap — input-order layout
+        prev_max = stats.max
+    return True  # every group range non-decreasing across the file
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CSV LOADING (FALLBACK)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def _load_csv(sample_frac: float | None = None) -> pd.DataFrame:
+def _load_csv(sample_frac: float | None = None,
+              columns: list[str] | None = None) -> pd.DataFrame:
     """
     Load from CSV format (slower but always available).
-    
+
     Performance:
     - 1% sample: ~2s
     - 5% sample: ~5s
     - 10% sample: ~12s
     - 100% sample: ~60+ seconds
     """
-    df = pd.read_csv(DATA_PATH, dtype=DTYPES)
-    
-    if sample_frac is not None:
-        if not (0 < sample_frac <= 1):
-            raise ValueError("sample_frac must be between 0 and 1")
-        df = df.sample(frac=sample_frac, random_state=42)
-    
-    return df.reset_index(drop=True)
+    import pandas as pd
+    import pyarrow.csv as pac
+
+    # pyarrow's CSV reader parses 64 MB blocks on all cores; pd.read_csv is
+    # single-threaded, so this alone is a 3-5x parse speedup on the full
+    # file. Column types come from the same DTYPES table as everywhere else.
+    table = pac.read_csv(
+        DATA_PATH,
+        read_options=pac.ReadOptions(use_threads=True, block_size=64 << 20),
+        convert_options=pac.ConvertOptions(
+            column_types=_arrow_types_from(DTYPES),
+            include_columns=columns,
+        ),
+    )
+
+    # nameDest repeats heavily (merchants receive many payments), so
+    # dictionary codes cut its memory vs a plain string column — same idea
+    # as the old .astype("category"), done once at the Arrow level.
+    if "nameDest" in table.column_names:
+        import pyarrow.compute as pc
+        i = table.column_names.index("nameDest")
+        table = table.set_column(
+            i, "nameDest", pc.dictionary_encode(table.column("nameDest")))
+
+    # Persist a parquet side-cache so later loads skip the CSV parse
+    # entirely (parquet read is typically 10-20x faster). Written from the
+    # Arrow table, NOT the DataFrame: df.to_parquet embeds pandas schema
+    # metadata whose ArrowDtype dictionary strings cannot be reconstructed
+    # on projected reads that drop a dictionary column. Only when the full
+    # schema was read — never cache a partial column set.
+    if columns is None:
+        try:
+            import pyarrow.parquet as pq
+            pq.write_table(table, PARQUET_PATH, compression='snappy')
+        except Exception:
+            pass  # data dir read-only — CSV path still works
+
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    # Only sampling touches the index — the freshly parsed frame
+    # already carries a RangeIndex.
+    k = _resolve_sample(len(df), sample_frac)
+    if k is not None:
+        df = _take_sample(df, k)
+
+    return df
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONVERSION UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════
 
-def convert_csv_to_parquet(input_csv: Path | None = None, 
-                           output_parquet: Path | None = None) -> None:
+def _arrow_types_from(dtypes: dict) -> dict:
+    """Map the pandas DTYPES table to pyarrow column types.
+
+    'category' becomes a dictionary type so dictionary encoding is
+    preserved across streamed batches.
+    """
+    import pyarrow as pa
+    mapping = {
+        # int32 indices: the CSV reader only converts to dictionary types
+        # with int32 indices (narrower indices raise ArrowNotImplementedError)
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "string": pa.string(),
+        "bool": pa.bool_(),
+        "int8": pa.int8(),
+        "uint8": pa.uint8(),
+        "uint16": pa.uint16(),
+        "int32": pa.int32(),
+        "float32": pa.float32(),
+    }
+    return {name: mapping[dt] for name, dt in dtypes.items()}
+
+
+def convert_csv_to_parquet(input_csv: Path | None = None,
+                           output_parquet: Path | None = None,
+                           compression: str = 'zstd',
+                           sort: bool = True) -> None:
     """
     Convert CSV to optimized parquet format for 10x faster loading.
-    
+
     One-time conversion, then all loads will be 10x faster!
-    
+
+    Dictionary + RLE encoding with zstd suits PaySim well: 5-category
+    `type`, heavily repeated ID prefixes and lots of zero balances compress
+    2-3x smaller than snappy with comparable decode speed — and load time
+    is dominated by compressed bytes read.
+
     Args:
         input_csv: Path to CSV file (default: data/paysim.csv)
         output_parquet: Path to output parquet (default: data/paysim.parquet)
-    
+        compression: Parquet codec ('zstd' default; pass 'snappy' for
+                    CPU-constrained environments)
+        sort: Sort by (type, isFraud, step) before writing (default True).
+             Input order is roughly time-sorted, so every row group holds
+             all 5 types and filter pushdown can never skip anything;
+             sorted, each group covers a narrow type/isFraud slice and the
+             footer statistics let load_data_by_type / load_fraud_only skip
+             most groups. Pass sort=False for the low-memory streaming path
+             on machines that cannot hold the full table.
+
     Example:
         >>> convert_csv_to_parquet()
         Converting paysim.csv to parquet...
@@ -169,24 +393,90 @@ def convert_csv_to_parquet(input_csv: Path | None = None,
         print(f"❌ Input file not found: {input_csv}")
         return
     
+    import pyarrow.csv as pac
+    import pyarrow.parquet as pq
+
     print(f"🔄 Converting {input_csv.name} to parquet...")
     print(f"   This may take 2-3 minutes...")
-    
-    # Load CSV
-    print("   Reading CSV...")
-    df = pd.read_csv(input_csv, dtype=DTYPES)
-    print(f"   Loaded {len(df):,} rows")
-    
+
     # Get file sizes
     csv_size = input_csv.stat().st_size / (1024**3)  # GB
-    
-    # Save to parquet
-    print("   Compressing to parquet...")
-    df.to_parquet(output_parquet, compression='snappy', index=False)
-    
+
+    if sort:
+        # Sorted write: one full-table parse + sort, then fixed-size row
+        # groups so type boundaries land near group edges. A one-time cost
+        # at conversion that pays back on every filtered read. Sorted data
+        # also run-length-encodes far better (type/isFraud become a handful
+        # of runs per group).
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        print(f"   Sorting by (type, isFraud, step) and writing ({compression})...")
+        # Arrow's sort kernel rejects dictionary columns, so `type` is read
+        # as plain strings for the sort and dictionary-encoded just before
+        # the write — the file still stores it dictionary-compressed.
+        column_types = _arrow_types_from(DTYPES)
+        column_types["type"] = pa.string()
+        table = pac.read_csv(
+            input_csv,
+            read_options=pac.ReadOptions(block_size=64 << 20),
+            convert_options=pac.ConvertOptions(column_types=column_types),
+        )
+        table = table.sort_by([("type", "ascending"),
+                               ("isFraud", "ascending"),
+                               ("step", "ascending")])
+        i = table.column_names.index("type")
+        table = table.set_column(
+            i, "type", pc.dictionary_encode(table.column("type")))
+        pq.write_table(
+            table,
+            output_parquet,
+            compression=compression,
+            compression_level=3 if compression == 'zstd' else None,
+            use_dictionary=True,
+            row_group_size=256_000,
+            data_page_size=1 << 20,
+            write_statistics=True,
+            version='2.6',
+        )
+        print(f"   Wrote {table.num_rows:,} rows")
+        _report_conversion(csv_size, output_parquet)
+        return
+
+    # Stream the conversion: parse one CSV block, write one row group,
+    # repeat. Peak memory is O(block_size) instead of holding the full CSV
+    # plus the parsed DataFrame in RAM at once, and parse/compress overlap.
+    # Explicit statistics keep filter pushdown skip-granularity fine;
+    # version 2.6 enables DELTA_BINARY_PACKED for the monotone-ish `step`.
+    print(f"   Streaming CSV -> parquet ({compression})...")
+    reader = pac.open_csv(
+        input_csv,
+        read_options=pac.ReadOptions(block_size=64 << 20),
+        convert_options=pac.ConvertOptions(column_types=_arrow_types_from(DTYPES)),
+    )
+    total_rows = 0
+    with pq.ParquetWriter(
+        output_parquet,
+        reader.schema,
+        compression=compression,
+        compression_level=3 if compression == 'zstd' else None,
+        use_dictionary=True,
+        data_page_size=1 << 20,
+        write_statistics=True,
+        version='2.6',
+    ) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            total_rows += batch.num_rows
+    print(f"   Wrote {total_rows:,} rows")
+    _report_conversion(csv_size, output_parquet)
+
+
+def _report_conversion(csv_size: float, output_parquet: Path) -> None:
+    """Print the conversion size summary."""
     parquet_size = output_parquet.stat().st_size / (1024**3)  # GB
     compression_ratio = csv_size / parquet_size
-    
+
     print(f"\n✅ Conversion complete!")
     print(f"   Original: {csv_size:.2f} GB (CSV)")
     print(f"   Compressed: {parquet_size:.2f} GB (Parquet)")
@@ -197,6 +487,14 @@ def convert_csv_to_parquet(input_csv: Path | None = None,
 # DATA STATISTICS
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Approximate in-memory bytes per row for the full DTYPES schema. Fixed-width
+# dtypes count their itemsize, 'category' its int32 dictionary code, and
+# 'string' the ~11-char PaySim ID ('C'/'M' + 10 digits).
+_DTYPE_BYTES = {"bool": 1, "uint8": 1, "uint16": 2, "int32": 4,
+                "float32": 4, "category": 4, "string": 11}
+_APPROX_ROW_BYTES = sum(_DTYPE_BYTES[dt] for dt in DTYPES.values())
+
+
 def get_data_info(use_parquet: bool = True) -> dict:
     """
     Get quick statistics about the dataset without loading all data.
@@ -213,75 +511,162 @@ def get_data_info(use_parquet: bool = True) -> dict:
         >>> print(f"Fraud rate: {info['fraud_rate']:.3f}%")
     """
     try:
-        # Try to load from parquet first
         if use_parquet and PARQUET_PATH.is_file():
-            df = pd.read_parquet(PARQUET_PATH)
-        else:
-            df = pd.read_csv(DATA_PATH, dtype=DTYPES)
-        
+            return _parquet_info()
+
+        # CSV fallback: only two columns are needed for the stats. isFraud
+        # is left to integer inference — the CSV spells it 0/1.
+        import pandas as pd
+        df = pd.read_csv(DATA_PATH, dtype={"type": "category"},
+                         usecols=["isFraud", "type"])
         fraud_count = df["isFraud"].sum()
         total = len(df)
-        
+
         return {
             "total_rows": total,
             "fraud_count": int(fraud_count),
             "fraud_rate": (fraud_count / total * 100) if total > 0 else 0,
             "transaction_types": df["type"].unique().tolist(),
-            "columns": df.columns.tolist(),
-            "memory_usage_mb": df.memory_usage(deep=True).sum() / (1024**2),
+            "columns": list(DTYPES),
+            # Full-schema estimate from the row count: only two columns
+            # were read, so measuring this frame would report ~1% of the
+            # dataset's real footprint (and deep=True on the full frame
+            # would walk every string cell in Python just to do better).
+            "memory_usage_mb": total * _APPROX_ROW_BYTES / (1024**2),
         }
     except Exception as e:
         return {"error": str(e)}
 
+
+def _parquet_info() -> dict:
+    """Dataset statistics from the parquet footer — no data pages decoded
+    unless a row group can actually contain fraud.
+
+    total_rows and per-group isFraud min/max live in the footer metadata,
+    so groups whose statistics prove max(isFraud)==0 (the vast majority —
+    fraud is ~0.13% of rows) are skipped outright; only the isFraud column
+    of the remaining groups is read to count exactly.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(PARQUET_PATH)
+    meta = pf.metadata
+    total = meta.num_rows
+    fraud_idx = meta.schema.to_arrow_schema().get_field_index("isFraud")
+
+    candidate_groups = []
+    for g in range(meta.num_row_groups):
+        stats = meta.row_group(g).column(fraud_idx).statistics
+        if stats is not None and stats.has_min_max and not stats.max:
+            continue  # statistics prove this group holds no fraud rows
+        candidate_groups.append(g)
+
+    fraud_count = 0
+    if candidate_groups:
+        col = pf.read_row_groups(candidate_groups, columns=["isFraud"])
+        # cast: Arrow's sum kernel wants a numeric type, isFraud is bool
+        fraud = pc.sum(pc.cast(col.column("isFraud"), "uint8")).as_py()
+        fraud_count = int(fraud or 0)
+
+    # `type` is dictionary-encoded with 5 categories — decoding just this
+    # column is a few MB of dictionary indices, not the whole file.
+    tx_types = pc.unique(
+        pf.read(columns=["type"]).column("type").cast("string")
+    ).to_pylist()
+
+    # Uncompressed size from the footer stands in for in-memory footprint
+    mem_bytes = sum(meta.row_group(g).total_byte_size
+                    for g in range(meta.num_row_groups))
+
+    return {
+        "total_rows": total,
+        "fraud_count": fraud_count,
+        "fraud_rate": (fraud_count / total * 100) if total > 0 else 0,
+        "transaction_types": tx_types,
+        "columns": list(DTYPES),
+        "memory_usage_mb": mem_bytes / (1024**2),
+    }
+
 # ═══════════════════════════════════════════════════════════════════════════
 # BATCH LOADING (For analysis)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def load_data_by_type(transaction_type: str, 
-                      sample_frac: float | None = None) -> pd.DataFrame:
+def load_data_by_type(transaction_type: str,
+                      sample_frac: float | None = None,
+                      columns: list[str] | None = None) -> pd.DataFrame:
     """
     Load data filtered by transaction type.
-    
+
     Args:
         transaction_type: Type of transaction (TRANSFER, CASH_OUT, PAYMENT, etc.)
         sample_frac: Fraction to sample
-    
+        columns: Subset of columns to return (None = all)
+
     Returns:
         Filtered DataFrame
-    
+
     Example:
         >>> df = load_data_by_type("CASH_OUT", sample_frac=0.05)
         >>> print(f"CASH_OUT transactions: {len(df):,}")
     """
-    df = load_data(sample_frac=None)  # Load all first
-    df = df[df["type"] == transaction_type]
-    
-    if sample_frac is not None:
-        df = df.sample(frac=sample_frac, random_state=42)
-    
-    return df.reset_index(drop=True)
+    import pandas as pd
+
+    # Always load the predicate column, drop it afterwards if unwanted
+    load_cols = None if columns is None else list(dict.fromkeys(columns + ["type"]))
+    if PARQUET_PATH.is_file():
+        # Predicate pushdown: row groups whose min/max statistics exclude
+        # this type are skipped instead of decoded and then masked away.
+        df = pd.read_parquet(PARQUET_PATH, columns=load_cols,
+                             filters=[("type", "==", transaction_type)])
+    else:
+        # Boolean masking leaves gaps in the index — reset here, once
+        df = load_data(sample_frac=None, columns=load_cols)
+        df = df[df["type"] == transaction_type].reset_index(drop=True)
+    if columns is not None:
+        df = df[columns]
 
-def load_fraud_only(sample_frac: float | None = None) -> pd.DataFrame:
+    k = _resolve_sample(len(df), sample_frac)
+    if k is not None:
+        df = _take_sample(df, k)
+
+    return df
+
+def load_fraud_only(sample_frac: float | None = None,
+                    columns: list[str] | None = None) -> pd.DataFrame:
     """
     Load only fraud transactions.
-    
+
     Args:
         sample_frac: Fraction to sample
-    
+        columns: Subset of columns to return (None = all)
+
     Returns:
         DataFrame with only fraud transactions
-    
+
     Example:
         >>> fraud_df = load_fraud_only()
         >>> print(f"Fraud cases: {len(fraud_df):,}")
     """
-    df = load_data(sample_frac=None)
-    df = df[df["isFraud"] == 1]
-    
-    if sample_frac is not None:
-        df = df.sample(frac=sample_frac, random_state=42)
-    
-    return df.reset_index(drop=True)
+    import pandas as pd
+
+    load_cols = None if columns is None else list(dict.fromkeys(columns + ["isFraud"]))
+    if PARQUET_PATH.is_file():
+        # isFraud==1 is ~0.13% of rows — pushdown avoids materializing the
+        # other 99.9% into pandas memory just to mask it out.
+        df = pd.read_parquet(PARQUET_PATH, columns=load_cols,
+                             filters=[("isFraud", "==", True)])
+    else:
+        df = load_data(sample_frac=None, columns=load_cols)
+        df = df[df["isFraud"].astype(bool)].reset_index(drop=True)
+    if columns is not None:
+        df = df[columns]
+
+    k = _resolve_sample(len(df), sample_frac)
+    if k is not None:
+        df = _take_sample(df, k)
+
+    return df
 
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN EXECUTION
@@ -4,6 +4,9 @@ src/prompts.py - System prompts for fraud detection
 Single production prompt that covers all requirements.
 """
 
+import sys
+import types
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PRODUCTION PROMPT (THE ONLY PROMPT)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -128,20 +131,12 @@ Score > +2.0:
   Decision: FRAUD
 
 
-█ OUTPUT FORMAT (STRICT)
-━━━━━━━━━━━━━━━━━━━━━━
-
-Agent Analysis (Step by Step)
+█ OUTPUT FORMAT (KEEP IT SHORT)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-1. [Type check and initial gating]
-2. [Signal A - Account behavior + score]
-3. [Signal B - Balance anomaly + score]
-4. [Signal C - Destination type + score]
-5. [Signal D - Amount context + score]
-
-FRAUD PROBABILITY: XX%
-REASON: [2-3 sentence summary]
-FINAL DECISION: [FRAUD / SUSPICIOUS / LEGITIMATE]
+Return the fraud probability, the final decision
+(FRAUD / SUSPICIOUS / LEGITIMATE), and 3 brief reasons — one short line
+per decisive signal. No long narrative.
 
 
 █ CORE PRINCIPLES (MUST FOLLOW)
@@ -156,25 +151,31 @@ FINAL DECISION: [FRAUD / SUSPICIOUS / LEGITIMATE]
 7. ✓ Require MULTIPLE signals for FRAUD decision
 """
 
+# Interned singleton: downstream caches keyed on string identity hit, and
+# every reference shares the same ~4 KB object.
+PRODUCTION_PROMPT = sys.intern(PRODUCTION_PROMPT)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PROMPT SELECTION FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════
 
+_MODES = frozenset({"production", "balanced", "conservative", "aggressive"})
+
+
 def get_system_prompt(mode: str = "production") -> str:
     """
     Get system prompt for fraud detection.
-    
+
     Args:
         mode: Analysis mode (currently only "production" is available)
-    
+
     Returns:
         System prompt string
     """
-    mode = mode.lower()
-    
-    # Single production prompt for all modes
+    # Single production prompt for all modes; frozenset membership avoids
+    # rebuilding a list per call in hot loops.
     # In the future, different modes can be added if needed
-    if mode in ["production", "balanced", "conservative", "aggressive"]:
+    if mode.lower() in _MODES:
         return PRODUCTION_PROMPT
     else:
         raise ValueError(
@@ -194,9 +195,5 @@ SYSTEM_PROMPT_CONSERVATIVE = PRODUCTION_PROMPT
 SYSTEM_PROMPT_BALANCED = PRODUCTION_PROMPT
 SYSTEM_PROMPT_AGGRESSIVE = PRODUCTION_PROMPT
 
-PROMPTS = {
-    "production": PRODUCTION_PROMPT,
-    "balanced": PRODUCTION_PROMPT,
-    "conservative": PRODUCTION_PROMPT,
-    "aggressive": PRODUCTION_PROMPT,
-}
\ No newline at end of file
+# Read-only view — avoids accidental copies or mutation of the mode table
+PROMPTS = types.MappingProxyType({mode: PRODUCTION_PROMPT for mode in _MODES})
\ No newline at end of file